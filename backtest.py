@@ -1,43 +1,77 @@
+import sys
 from datetime import datetime
 
 from binance_trade_bot import backtest
 
+# Also collate and print the BTC fee value, paid fees and raw balances on
+# every boundary. collate_fees walks every coin balance, so this is off by
+# default to keep it out of the hot path.
+VERBOSE_FEES = False
+
 if __name__ == "__main__":
-    history = []
     start_time = datetime(2021, 6, 1, 0, 0)
     end_time = datetime(2021, 7, 1, 23, 59)
     print(f"BACKTEST from {start_time} to {end_time}")
-    current_date = start_time.strftime("%d/%m/%Y")
+    base_btc = base_bridge = None
+    current_day = start_time.date()
+    bridge_sym = None
     for manager in backtest(start_time, end_time):
-        btc_value = manager.collate_coins("BTC")
-        bridge_value = manager.collate_coins(manager.config.BRIDGE.symbol)
-        btc_fees_value = manager.collate_fees("BTC")
-        bridge_fees_value = manager.collate_fees(manager.config.BRIDGE.symbol)
-        trades = manager.trades
-        history.append((btc_value, bridge_value, trades, btc_fees_value, bridge_fees_value))
-        btc_diff = round((btc_value - history[0][0]) / history[0][0] * 100, 3)
-        bridge_diff = round((bridge_value - history[0][1]) / history[0][1] * 100, 3)
-        if manager.datetime.strftime("%d/%m/%Y") != current_date:
-            current_date = manager.datetime.strftime("%d/%m/%Y")
-            print("------")
-            print("TIME:", manager.datetime)
-            print("TRADES:", trades)
-            #print("PAID FEES:", manager.paid_fees)
-            #print("BTC FEES VALUE:", btc_fees_value)
-            print(f"{manager.config.BRIDGE.symbol} FEES VALUE:", bridge_fees_value)
-            #print("BALANCES:", manager.balances)
-            print("BTC VALUE:", btc_value, f"({btc_diff}%)")
-            print(f"{manager.config.BRIDGE.symbol} VALUE:", bridge_value, f"({bridge_diff}%)")
-            print("------")
-    print("------")
-    print("TIME:", manager.datetime)
-    print("TRADES:", trades)
-    print("POSITIVE COIN JUMPS:", manager.positve_coin_jumps)
-    print("NEVATIVE COIN JUMPS:", manager.negative_coin_jumps)
-    #print("PAID FEES:", manager.paid_fees)
-    #print("BTC FEES VALUE:", btc_fees_value)
-    print(f"{manager.config.BRIDGE.symbol} FEES VALUE:", bridge_fees_value)
-    #print("BALANCES:", manager.balances)
-    print("BTC VALUE:", btc_value, f"({btc_diff}%)")
-    print(f"{manager.config.BRIDGE.symbol} VALUE:", bridge_value, f"({bridge_diff}%)")
-    print("------")
+        if bridge_sym is None:
+            # First yield: cache the bridge symbol and record the baseline values
+            bridge_sym = manager.config.BRIDGE.symbol
+            # The same manager instance is yielded every time; bind the bound
+            # methods once instead of looking them up on every boundary
+            collate_coins = manager.collate_coins
+            collate_fees = manager.collate_fees
+            base_btc = collate_coins("BTC")
+            base_bridge = collate_coins(bridge_sym)
+            # Prove the bases are usable once so every later diff can divide
+            # (via the cached reciprocals) without a zero check
+            assert base_btc > 0 and base_bridge > 0, "baseline collation returned a non-positive value"
+            # One divide here instead of one per diff computation below
+            inv_base_btc_100 = 100.0 / base_btc
+            inv_base_bridge_100 = 100.0 / base_bridge
+        dt = manager.datetime
+        day = dt.date()
+        if day != current_day:
+            current_day = day
+            btc_value = collate_coins("BTC")
+            bridge_value = collate_coins(bridge_sym)
+            bridge_fees_value = collate_fees(bridge_sym)
+            trades = manager.trades
+            btc_diff = btc_value * inv_base_btc_100 - 100.0
+            bridge_diff = bridge_value * inv_base_bridge_100 - 100.0
+            lines = ["------", f"TIME: {dt}", f"TRADES: {trades}"]
+            if VERBOSE_FEES:
+                lines.append(f"PAID FEES: {manager.paid_fees}")
+                lines.append(f"BTC FEES VALUE: {collate_fees('BTC')}")
+            lines.append(f"{bridge_sym} FEES VALUE: {bridge_fees_value}")
+            if VERBOSE_FEES:
+                lines.append(f"BALANCES: {manager.balances}")
+            lines.append(f"BTC VALUE: {btc_value} ({btc_diff:.3f}%)")
+            lines.append(f"{bridge_sym} VALUE: {bridge_value} ({bridge_diff:.3f}%)")
+            lines.append("------")
+            sys.stdout.write("\n".join(lines) + "\n")
+    btc_value = collate_coins("BTC")
+    bridge_value = collate_coins(bridge_sym)
+    bridge_fees_value = collate_fees(bridge_sym)
+    trades = manager.trades
+    btc_diff = btc_value * inv_base_btc_100 - 100.0
+    bridge_diff = bridge_value * inv_base_bridge_100 - 100.0
+    lines = [
+        "------",
+        f"TIME: {manager.datetime}",
+        f"TRADES: {trades}",
+        f"POSITIVE COIN JUMPS: {manager.positve_coin_jumps}",
+        f"NEVATIVE COIN JUMPS: {manager.negative_coin_jumps}",
+    ]
+    if VERBOSE_FEES:
+        lines.append(f"PAID FEES: {manager.paid_fees}")
+        lines.append(f"BTC FEES VALUE: {collate_fees('BTC')}")
+    lines.append(f"{bridge_sym} FEES VALUE: {bridge_fees_value}")
+    if VERBOSE_FEES:
+        lines.append(f"BALANCES: {manager.balances}")
+    lines.append(f"BTC VALUE: {btc_value} ({btc_diff:.3f}%)")
+    lines.append(f"{bridge_sym} VALUE: {bridge_value} ({bridge_diff:.3f}%)")
+    lines.append("------")
+    sys.stdout.write("\n".join(lines) + "\n")
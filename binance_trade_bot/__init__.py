@@ -2,4 +2,4 @@ from .backtest import backtest
 from .database_warmup import warmup_database
 from .binance_api_manager import BinanceAPIManager
 from .crypto_trading import main as run_trader
-from .deposits import deposit
+from .deposits import deposit, deposit_batch
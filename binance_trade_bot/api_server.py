@@ -7,7 +7,7 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from .config import Config
 from .database import Database
@@ -50,7 +50,13 @@ def filter_period(query, model):  # pylint: disable=inconsistent-return-statemen
 def value_history(coin: str = None):
     session: Session
     with db.db_session() as session:
-        query = session.query(CoinValue).order_by(CoinValue.coin_id.asc(), CoinValue.datetime.asc())
+        # Declare the relations each endpoint touches; anything else raises
+        # instead of silently firing per-row lazy loads
+        query = (
+            session.query(CoinValue)
+            .options(selectinload(CoinValue.coin), raiseload("*"))
+            .order_by(CoinValue.coin_id.asc(), CoinValue.datetime.asc())
+        )
 
         query = filter_period(query, CoinValue)
 
@@ -82,7 +88,11 @@ def total_value_history():
 def trade_history():
     session: Session
     with db.db_session() as session:
-        query = session.query(Trade).order_by(Trade.datetime.asc())
+        query = (
+            session.query(Trade)
+            .options(selectinload(Trade.alt_coin), selectinload(Trade.crypto_coin), raiseload("*"))
+            .order_by(Trade.datetime.asc())
+        )
 
         query = filter_period(query, Trade)
 
@@ -99,6 +109,11 @@ def scouting_history():
         query = (
             session.query(ScoutHistory)
             .join(ScoutHistory.pair)
+            .options(
+                selectinload(ScoutHistory.pair).selectinload(Pair.from_coin),
+                selectinload(ScoutHistory.pair).selectinload(Pair.to_coin),
+                raiseload("*"),
+            )
             .filter(Pair.from_coin_id == coin)
             .order_by(ScoutHistory.datetime.asc())
         )
@@ -119,7 +134,7 @@ def current_coin():
 def current_coin_history():
     session: Session
     with db.db_session() as session:
-        query = session.query(CurrentCoin)
+        query = session.query(CurrentCoin).options(selectinload(CurrentCoin.coin), raiseload("*"))
 
         query = filter_period(query, CurrentCoin)
 
@@ -140,7 +155,11 @@ def coins():
 def pairs():
     session: Session
     with db.db_session() as session:
-        all_pairs: List[Pair] = session.query(Pair).all()
+        all_pairs: List[Pair] = (
+            session.query(Pair)
+            .options(selectinload(Pair.from_coin), selectinload(Pair.to_coin), raiseload("*"))
+            .all()
+        )
         return jsonify([pair.info() for pair in all_pairs])
 
 
@@ -1,7 +1,8 @@
-from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import groupby
 from typing import Dict, List
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from .binance_api_manager import BinanceAPIManager
@@ -10,6 +11,26 @@ from .database import Database, LogScout
 from .logger import Logger
 from .models import Coin, CoinValue, Pair
 
+# How long a _get_ratios result stays fresh; long enough for bridge_scout to
+# reuse the ratios the scout just computed, short enough to never act on a
+# stale price
+RATIOS_CACHE_TTL = timedelta(seconds=1)
+
+
+def _ratio_default_kernel(coin_price, pair_ratios, opt_prices, from_fees, to_fees, scout_multiplier):
+    # Obtain (current coin)/(optional coin) for every candidate
+    coin_opt_coin_ratios = coin_price / opt_prices
+    transaction_fees = from_fees + to_fees
+
+    return (coin_opt_coin_ratios - transaction_fees * scout_multiplier * coin_opt_coin_ratios) - pair_ratios
+
+
+def _ratio_margin_kernel(coin_price, pair_ratios, opt_prices, from_fees, to_fees, scout_multiplier):
+    coin_opt_coin_ratios = coin_price / opt_prices
+    transaction_fees = from_fees + to_fees - from_fees * to_fees
+
+    return (1 - transaction_fees) * coin_opt_coin_ratios / pair_ratios - (1 + scout_multiplier / 100)
+
 
 class AutoTrader:
     def __init__(self, binance_manager: BinanceAPIManager, database: Database, logger: Logger, config: Config):
@@ -18,6 +39,16 @@ class AutoTrader:
         self.logger = logger
         self.config = config
         self.failed_buy_order = False
+        # Pair rows only change when trade thresholds are rewritten, so they
+        # are cached per from-coin and dropped whenever ratios are updated
+        self._pairs_from_cache: Dict[str, List[Pair]] = {}
+        self._ratios_cache: Dict[tuple, tuple] = {}
+        # RATIO_CALC never changes after config load, so the formula is
+        # resolved to a bound method once instead of per scout
+        if config.RATIO_CALC == config.RATIO_CALC_SCOUT_MARGIN:
+            self._ratio_fn = self._ratio_margin
+        else:
+            self._ratio_fn = self._ratio_default
 
     def initialize(self):
         self.initialize_trade_thresholds()
@@ -26,26 +57,26 @@ class AutoTrader:
         """
         Jump from the source coin to the destination coin through bridge coin
         """
+        manager = self.manager
+        bridge = self.config.BRIDGE
+
         can_sell = False
-        balance = self.manager.get_currency_balance(pair.from_coin.symbol)
+        balance = manager.get_currency_balance(pair.from_coin.symbol)
 
-        if balance and balance * sell_price > self.manager.get_min_notional(
-            pair.from_coin.symbol, self.config.BRIDGE.symbol
-        ):
+        if balance and balance * sell_price > manager.get_min_notional(pair.from_coin.symbol, bridge.symbol):
             can_sell = True
         else:
             self.logger.info("Skipping sell")
 
-        if can_sell and self.manager.sell_alt(pair.from_coin, self.config.BRIDGE, sell_price) is None:
+        if can_sell and manager.sell_alt(pair.from_coin, bridge, sell_price) is None:
             self.logger.info("Couldn't sell, going back to scouting mode...")
             return None
 
-        result = self.manager.buy_alt(pair.to_coin, self.config.BRIDGE, buy_price)
+        result = manager.buy_alt(pair.to_coin, bridge, buy_price)
         if result is not None:
             self.db.set_current_coin(pair.to_coin)
-            price = result.price
-            if abs(price) < 1e-15:
-                price = result.cumulative_quote_qty / result.cumulative_filled_quantity
+            # 0.0 is falsy, so an unfilled price falls through to the average
+            price = result.price or result.cumulative_quote_qty / result.cumulative_filled_quantity
 
             self.update_trade_threshold(pair.to_coin, price)
             self.failed_buy_order = False
@@ -60,58 +91,86 @@ class AutoTrader:
         Update all the coins with the threshold of buying the current held coin
         """
 
+        bridge_sym = self.config.BRIDGE.symbol
+
         if coin_price is None or coin_price == 0.0:
-            self.logger.info("Skipping update... current coin {} not found".format(coin + self.config.BRIDGE))
+            self.logger.info("Skipping update... current coin {} not found".format(coin.symbol + bridge_sym))
             return
 
         session: Session
         with self.db.db_session() as session:
+            updates = []
             for pair in session.query(Pair).filter(Pair.to_coin == coin):
-                from_coin_price = self.manager.get_sell_price(pair.from_coin + self.config.BRIDGE)
+                # Plain symbol concatenation avoids a Coin.__add__ dispatch per pair
+                from_coin_price = self.manager.get_sell_price(pair.from_coin.symbol + bridge_sym)
 
                 if from_coin_price is None:
                     self.logger.info(
-                        "Skipping update for coin {} not found".format(pair.from_coin + self.config.BRIDGE)
+                        "Skipping update for coin {} not found".format(pair.from_coin.symbol + bridge_sym)
                     )
                     continue
-                
+
                 # check if we hold above min_notional coins of from_coin. If so skip ratio update.
-                from_coin_balance = self.manager.get_currency_balance(pair.from_coin.symbol)          
-                min_notional = self.manager.get_min_notional(pair.from_coin.symbol, self.config.BRIDGE.symbol)
-                if from_coin_price * from_coin_balance > min_notional:
+                # A zero balance can never clear min_notional, so the filter
+                # lookup only happens for coins we actually hold
+                from_coin_balance = self.manager.get_currency_balance(pair.from_coin.symbol)
+                if from_coin_balance > 0 and from_coin_price * from_coin_balance > self.manager.get_min_notional(
+                    pair.from_coin.symbol, bridge_sym
+                ):
                     continue
 
-                pair.ratio = from_coin_price / coin_price
+                updates.append({"id": pair.id, "ratio": from_coin_price / coin_price})
+            # One bulk UPDATE instead of a dirty-tracked flush per pair
+            if updates:
+                session.bulk_update_mappings(Pair, updates)
+        self._pairs_from_cache.clear()
 
     def initialize_trade_thresholds(self):
         """
         Initialize the buying threshold of all the coins for trading between them
         """
+        bridge_sym = self.config.BRIDGE.symbol
         session: Session
         with self.db.db_session() as session:
-            pairs = session.query(Pair).filter(Pair.ratio.is_(None)).all()
-            grouped_pairs = defaultdict(list)
-            for pair in pairs:
-                if pair.from_coin.enabled and pair.to_coin.enabled:
-                    grouped_pairs[pair.from_coin.symbol].append(pair)
-            for from_coin_symbol, group in grouped_pairs.items():
+            pairs = [
+                pair
+                for pair in session.query(Pair).filter(Pair.ratio.is_(None))
+                if pair.from_coin.enabled and pair.to_coin.enabled
+            ]
+            # Sorting once and streaming the groups avoids materializing a
+            # symbol-keyed dict of lists
+            pairs.sort(key=lambda pair: pair.from_coin.symbol)
+
+            # Every needed price comes from two bulk snapshots instead of one
+            # fetch per pair
+            sell_prices = self.manager.get_sell_prices(
+                list({pair.from_coin.symbol + bridge_sym for pair in pairs})
+            )
+            buy_prices = self.manager.get_buy_prices(list({pair.to_coin.symbol + bridge_sym for pair in pairs}))
+
+            updates = []
+            for from_coin_symbol, group_iter in groupby(pairs, key=lambda pair: pair.from_coin.symbol):
+                group = list(group_iter)
                 self.logger.info(f"Initializing {from_coin_symbol} vs [{', '.join([p.to_coin.symbol for p in group])}]")
-                for pair in group:
-                    from_coin_price = self.manager.get_sell_price(pair.from_coin + self.config.BRIDGE)
-                    if from_coin_price is None:
-                        self.logger.info(
-                            "Skipping initializing {}, symbol not found".format(pair.from_coin + self.config.BRIDGE)
-                        )
-                        continue
+                from_coin_price = sell_prices[from_coin_symbol + bridge_sym]
+                if from_coin_price is None:
+                    self.logger.info(
+                        "Skipping initializing {}, symbol not found".format(from_coin_symbol + bridge_sym)
+                    )
+                    continue
 
-                    to_coin_price = self.manager.get_buy_price(pair.to_coin + self.config.BRIDGE)
+                for pair in group:
+                    to_coin_price = buy_prices[pair.to_coin.symbol + bridge_sym]
                     if to_coin_price is None or to_coin_price == 0.0:
                         self.logger.info(
-                            "Skipping initializing {}, symbol not found".format(pair.to_coin + self.config.BRIDGE)
+                            "Skipping initializing {}, symbol not found".format(pair.to_coin.symbol + bridge_sym)
                         )
                         continue
 
-                    pair.ratio = from_coin_price / to_coin_price
+                    updates.append({"id": pair.id, "ratio": from_coin_price / to_coin_price})
+            if updates:
+                session.bulk_update_mappings(Pair, updates)
+        self._pairs_from_cache.clear()
 
     def scout(self):
         """
@@ -119,85 +178,133 @@ class AutoTrader:
         """
         raise NotImplementedError()
 
+    def _get_pairs_from(self, coin: Coin) -> List[Pair]:
+        """
+        Get the pairs from a coin, cached until the trade thresholds change
+        """
+        pairs = self._pairs_from_cache.get(coin.symbol)
+        if pairs is None:
+            pairs = self.db.get_pairs_from(coin)
+            self._pairs_from_cache[coin.symbol] = pairs
+        return pairs
+
     def _get_ratios(self, coin: Coin, coin_price, excluded_coins: List[Coin] = []):
         """
         Given a coin, get the current price ratio for every other enabled coin
         """
-        ratio_dict: Dict[Pair, float] = {}
+        cache_key = (coin.symbol, tuple(sorted(c.symbol for c in excluded_coins)))
+        cached = self._ratios_cache.get(cache_key)
+        now = self.manager.now()
+        if cached is not None and now - cached[0] < RATIOS_CACHE_TTL:
+            return cached[1]
+
         prices: Dict[str, float] = {}
 
         scout_logs = []
+        pairs: List[Pair] = []
+        pair_ratios = []
+        opt_prices = []
+        from_fees = []
+        to_fees = []
+        bridge = self.config.BRIDGE
+        bridge_sym = bridge.symbol
+        # The sell-side fee only depends on the coin being scouted from, so it
+        # is loop-invariant; buy-side fees repeat whenever the same to_coin
+        # shows up again, so they are memoized per symbol
+        from_fee = self.manager.get_fee(coin, bridge, True)
+        to_fee_cache: Dict[str, float] = {}
         excluded_coin_symbols = [c.symbol for c in excluded_coins]
-        for pair in self.db.get_pairs_from(coin):
-            #skip excluded coins
-            if pair.to_coin.symbol in excluded_coin_symbols:
-                continue
-
-            optional_coin_price = self.manager.get_buy_price(pair.to_coin + self.config.BRIDGE)
+        #skip excluded coins
+        candidate_pairs = [
+            pair for pair in self._get_pairs_from(coin) if pair.to_coin.symbol not in excluded_coin_symbols
+        ]
+        # One snapshot for all candidate prices instead of a fetch per pair
+        buy_prices = self.manager.get_buy_prices([pair.to_coin.symbol + bridge_sym for pair in candidate_pairs])
+        for pair in candidate_pairs:
+            optional_coin_price = buy_prices[pair.to_coin.symbol + bridge_sym]
             prices[pair.to_coin_id] = optional_coin_price
 
             if optional_coin_price is None or optional_coin_price == 0.0:
                 self.logger.info(
-                    "Skipping scouting... optional coin {} not found".format(pair.to_coin + self.config.BRIDGE)
+                    "Skipping scouting... optional coin {} not found".format(pair.to_coin.symbol + bridge_sym)
                 )
                 continue
 
             scout_logs.append(LogScout(pair, pair.ratio, coin_price, optional_coin_price))
 
-            # Obtain (current coin)/(optional coin)
-            coin_opt_coin_ratio = coin_price / optional_coin_price
+            to_fee = to_fee_cache.get(pair.to_coin.symbol)
+            if to_fee is None:
+                to_fee = self.manager.get_fee(pair.to_coin, bridge, False)
+                to_fee_cache[pair.to_coin.symbol] = to_fee
+
+            # Gather everything into parallel columns; the ratio arithmetic for
+            # all pairs happens in one vectorized pass below
+            pairs.append(pair)
+            pair_ratios.append(pair.ratio)
+            opt_prices.append(optional_coin_price)
+            from_fees.append(from_fee)
+            to_fees.append(to_fee)
+        self.db.batch_log_scout(scout_logs)
 
-            from_fee = self.manager.get_fee(pair.from_coin, self.config.BRIDGE, True)
-            to_fee =  self.manager.get_fee(pair.to_coin, self.config.BRIDGE, False)
+        pair_ratios = np.asarray(pair_ratios, dtype=np.float64)
+        opt_prices = np.asarray(opt_prices, dtype=np.float64)
+        from_fees = np.asarray(from_fees, dtype=np.float64)
+        to_fees = np.asarray(to_fees, dtype=np.float64)
 
-            if self.config.RATIO_CALC == self.config.RATIO_CALC_DEFAULT:
-                transaction_fee = from_fee + to_fee
+        vals = self._ratio_fn(coin_price, pair_ratios, opt_prices, from_fees, to_fees)
 
-                ratio_dict[pair] = (
-                    coin_opt_coin_ratio - transaction_fee * self.config.SCOUT_MULTIPLIER * coin_opt_coin_ratio
-                ) - pair.ratio
-            if self.config.RATIO_CALC == self.config.RATIO_CALC_SCOUT_MARGIN:
-                transaction_fee = from_fee + to_fee - from_fee * to_fee
+        # The raw vals array travels along with the dict so callers can reduce
+        # over it without rebuilding an array from the dict values
+        ratio_dict: Dict[Pair, float] = dict(zip(pairs, vals.tolist()))
+        result = (ratio_dict, prices, vals)
+        self._ratios_cache[cache_key] = (now, result)
+        return result
 
-                ratio_dict[pair] = (1 - transaction_fee) * coin_opt_coin_ratio / pair.ratio - (1 + self.config.SCOUT_MULTIPLIER / 100)
-        self.db.batch_log_scout(scout_logs)
-        return (ratio_dict, prices)
+    def _ratio_default(self, coin_price, pair_ratios, opt_prices, from_fees, to_fees):
+        return _ratio_default_kernel(
+            coin_price, pair_ratios, opt_prices, from_fees, to_fees, self.config.SCOUT_MULTIPLIER
+        )
+
+    def _ratio_margin(self, coin_price, pair_ratios, opt_prices, from_fees, to_fees):
+        return _ratio_margin_kernel(
+            coin_price, pair_ratios, opt_prices, from_fees, to_fees, self.config.SCOUT_MULTIPLIER
+        )
 
     def _jump_to_best_coin(self, coin: Coin, coin_price: float, excluded_coins: List[Coin] = []):
         """
         Given a coin, search for a coin to jump to
         """
-        ratio_dict, prices = self._get_ratios(coin, coin_price, excluded_coins)
-
-        # keep only ratios bigger than zero
-        ratio_dict = {k: v for k, v in ratio_dict.items() if v > 0}
+        ratio_dict, prices, vals = self._get_ratios(coin, coin_price, excluded_coins)
 
-        # if we have any viable options, pick the one with the biggest ratio
-        if ratio_dict:
-            best_pair = max(ratio_dict, key=ratio_dict.get)
-            self.logger.info(f"Will be jumping from {coin} to {best_pair.to_coin_id}")
-            self.transaction_through_bridge(best_pair, coin_price, prices[best_pair.to_coin_id])
+        if vals.size:
+            # Pick the biggest ratio in one argmax pass; it is only a viable
+            # jump if it is above zero
+            best_idx = int(np.argmax(vals))
+            if vals[best_idx] > 0:
+                best_pair = list(ratio_dict)[best_idx]
+                self.logger.info(f"Will be jumping from {coin} to {best_pair.to_coin_id}")
+                self.transaction_through_bridge(best_pair, coin_price, prices[best_pair.to_coin_id])
 
     def bridge_scout(self):
         """
         If we have any bridge coin leftover, buy a coin with it that we won't immediately trade out of
         """
-        bridge_balance = self.manager.get_currency_balance(self.config.BRIDGE.symbol)
+        manager = self.manager
+        bridge_sym = self.config.BRIDGE.symbol
+        bridge_balance = manager.get_currency_balance(bridge_sym)
 
         for coin in self.db.get_coins():
-            current_coin_price = self.manager.get_sell_price(coin + self.config.BRIDGE)
+            current_coin_price = manager.get_sell_price(coin.symbol + bridge_sym)
 
             if current_coin_price is None:
                 continue
 
-            ratio_dict, _ = self._get_ratios(coin, current_coin_price)
-            if not any(v > 0 for v in ratio_dict.values()):
+            _, _, vals = self._get_ratios(coin, current_coin_price)
+            if vals.size == 0 or vals.max() <= 0:
                 # There will only be one coin where all the ratios are negative. When we find it, buy it if we can
-                if bridge_balance > self.manager.get_min_notional(coin.symbol, self.config.BRIDGE.symbol):
+                if bridge_balance > manager.get_min_notional(coin.symbol, bridge_sym):
                     self.logger.info(f"Will be purchasing {coin} using bridge coin")
-                    result = self.manager.buy_alt(
-                        coin, self.config.BRIDGE, self.manager.get_sell_price(coin + self.config.BRIDGE)
-                    )
+                    result = manager.buy_alt(coin, self.config.BRIDGE, manager.get_sell_price(coin.symbol + bridge_sym))
                     if result is not None:
                         self.db.set_current_coin(coin)
                         self.failed_buy_order = False
@@ -212,14 +319,18 @@ class AutoTrader:
         """
         now = datetime.now()
 
+        manager = self.manager
         coins = self.db.get_coins(True)
+        bridge_sym = self.config.BRIDGE_SYMBOL
+        # One snapshot covers the bridge and BTC quotes of every coin
+        prices = manager.get_ticker_prices([coin.symbol + quote for coin in coins for quote in (bridge_sym, "BTC")])
         cv_batch = []
         for coin in coins:
-            balance = self.manager.get_currency_balance(coin.symbol)
+            balance = manager.get_currency_balance(coin.symbol)
             if balance == 0:
                 continue
-            usd_value = self.manager.get_ticker_price(coin + self.config.BRIDGE_SYMBOL)
-            btc_value = self.manager.get_ticker_price(coin + "BTC")
+            usd_value = prices[coin.symbol + bridge_sym]
+            btc_value = prices[coin.symbol + "BTC"]
             cv = CoinValue(coin, balance, usd_value, btc_value, datetime=now)
             cv_batch.append(cv)
         self.db.batch_update_coin_values(cv_batch)
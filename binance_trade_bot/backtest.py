@@ -64,6 +64,13 @@ class MockBinanceManager(BinanceAPIManager):
             price = price * 0.998
         return price
 
+    def get_buy_prices(self, ticker_symbols):
+        # Historic prices come from the kline cache, one symbol at a time
+        return {ticker_symbol: self.get_buy_price(ticker_symbol) for ticker_symbol in ticker_symbols}
+
+    def get_sell_prices(self, ticker_symbols):
+        return {ticker_symbol: self.get_sell_price(ticker_symbol) for ticker_symbol in ticker_symbols}
+
     def get_ticker_price(self, ticker_symbol: str):
         """
         Get ticker price of a specific coin
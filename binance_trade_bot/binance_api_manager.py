@@ -6,7 +6,7 @@ import time
 import traceback
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
@@ -96,7 +96,7 @@ class BinanceOrderBalanceManager(AbstractOrderBalanceManager):
                         for currency_balance in self.binance_client.get_account()["balances"]
                     }
                 )
-                self.logger.debug(f"Fetched all balances: {cache_balances}")
+                self.logger.debug(f"Fetched all balances ({len(cache_balances)} assets)")
                 if currency_symbol not in cache_balances:
                     cache_balances[currency_symbol] = 0.0
                     return 0.0
@@ -230,6 +230,53 @@ class BinanceAPIManager:
         else:
             return self.get_ticker_price(ticker_symbol)
 
+    def get_buy_prices(self, ticker_symbols: List[str]) -> Dict[str, float]:
+        """
+        Get buy prices of multiple coins with at most one order book snapshot
+        """
+        if self.config.PRICE_TYPE == Config.PRICE_TYPE_ORDERBOOK:
+            self._load_orderbook_tickers(ticker_symbols)
+        return {ticker_symbol: self.get_buy_price(ticker_symbol) for ticker_symbol in ticker_symbols}
+
+    def get_sell_prices(self, ticker_symbols: List[str]) -> Dict[str, float]:
+        """
+        Get sell prices of multiple coins with at most one order book snapshot
+        """
+        if self.config.PRICE_TYPE == Config.PRICE_TYPE_ORDERBOOK:
+            self._load_orderbook_tickers(ticker_symbols)
+        return {ticker_symbol: self.get_sell_price(ticker_symbol) for ticker_symbol in ticker_symbols}
+
+    def _load_orderbook_tickers(self, ticker_symbols: List[str]):
+        """
+        Seed the order book cache with a single snapshot for any symbols that
+        would otherwise each need their own REST call
+        """
+        missing = [
+            ticker_symbol
+            for ticker_symbol in ticker_symbols
+            if ticker_symbol not in self.cache.ticker_values_ask
+            and ticker_symbol not in self.cache.non_existent_tickers
+        ]
+        if not missing:
+            return
+        tickers = {ticker["symbol"]: ticker for ticker in self.binance_client.get_orderbook_tickers()}
+        for ticker_symbol in missing:
+            ticker = tickers.get(ticker_symbol)
+            if ticker is None:
+                self.logger.info(f"Ticker does not exist: {ticker_symbol} - will not be fetched from now on")
+                self.cache.non_existent_tickers.add(ticker_symbol)
+                continue
+            self.cache.ticker_values_ask[ticker_symbol] = float(ticker["askPrice"])
+            self.cache.ticker_values_bid[ticker_symbol] = float(ticker["bidPrice"])
+
+    def get_ticker_prices(self, ticker_symbols: List[str]) -> Dict[str, float]:
+        """
+        Get ticker prices of multiple coins with at most one price snapshot
+        """
+        # get_ticker_price refreshes the whole ticker cache on a miss, so the
+        # first missing symbol pays for the snapshot and the rest are lookups
+        return {ticker_symbol: self.get_ticker_price(ticker_symbol) for ticker_symbol in ticker_symbols}
+
     def get_ticker_price(self, ticker_symbol: str):
         """
         Get ticker price of a specific coin
@@ -239,7 +286,8 @@ class BinanceAPIManager:
             self.cache.ticker_values = {
                 ticker["symbol"]: float(ticker["price"]) for ticker in self.binance_client.get_symbol_ticker()
             }
-            self.logger.debug(f"Fetched all ticker prices: {self.cache.ticker_values}")
+            # Formatting the whole snapshot is hot-path work; log its size only
+            self.logger.debug(f"Fetched all ticker prices ({len(self.cache.ticker_values)} symbols)")
             price = self.cache.ticker_values.get(ticker_symbol, None)
             if price is None:
                 self.logger.info(f"Ticker does not exist: {ticker_symbol} - will not be fetched from now on")
@@ -304,12 +352,17 @@ class BinanceAPIManager:
             time.sleep(1)
         return None
 
+    @cached(cache=TTLCache(maxsize=1, ttl=43200))
+    def _get_symbol_filters_table(self) -> Dict[str, Dict[str, dict]]:
+        # One exchange-info call covers the filters of every symbol, so a
+        # single snapshot replaces one get_symbol_info round trip per symbol
+        return {
+            symbol_info["symbol"]: {_filter["filterType"]: _filter for _filter in symbol_info["filters"]}
+            for symbol_info in self.binance_client.get_exchange_info()["symbols"]
+        }
+
     def get_symbol_filter(self, origin_symbol: str, target_symbol: str, filter_type: str):
-        return next(
-            _filter
-            for _filter in self.binance_client.get_symbol_info(origin_symbol + target_symbol)["filters"]
-            if _filter["filterType"] == filter_type
-        )
+        return self._get_symbol_filters_table()[origin_symbol + target_symbol][filter_type]
 
     @cached(cache=TTLCache(maxsize=2000, ttl=43200))
     def get_alt_tick(self, origin_symbol: str, target_symbol: str):
@@ -66,4 +66,5 @@ def main():
             schedule.run_pending()
             time.sleep(1)
     finally:
+        db.flush_scout_log_buffer()
         manager.stream_manager.close()
@@ -9,7 +9,7 @@ from typing import List, Optional, Union
 
 from socketio import Client
 from socketio.exceptions import ConnectionError as SocketIOConnectionError
-from sqlalchemy import create_engine, func, insert, select, update, Float
+from sqlalchemy import create_engine, event, func, insert, select, update, Float
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from .models.deposit import Deposit
@@ -19,15 +19,39 @@ from .models import *  # pylint: disable=wildcard-import
 
 LogScout = namedtuple("LogScout", ["pair", "target_ratio", "coin_price", "optional_coin_price"])
 
+# Scout logs are buffered in memory and flushed once either limit is hit, so
+# one transaction carries several scout cycles instead of one commit per tick
+SCOUT_LOG_BATCH_SIZE = 500
+SCOUT_LOG_FLUSH_SECONDS = 60
+
 
 class Database:
     def __init__(self, logger: Logger, config: Config, uri="sqlite:///data/crypto_trading.db", isTest=False):
         self.logger = logger
         self.config = config
-        self.engine = create_engine(uri)
+        # A larger statement cache keeps the hot scout/API statements compiled
+        self.engine = create_engine(uri, query_cache_size=1200)
+        if uri.startswith("sqlite:"):
+            # The scout loop commits log rows every tick; WAL with relaxed
+            # syncing keeps those commits from paying an fsync each time
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):  # pylint: disable=unused-variable
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                cursor.execute("PRAGMA cache_size=-65536")
+                cursor.close()
+
         self.session_factory = scoped_session(sessionmaker(bind=self.engine))
         self.socketio_client = Client()
         self.isTest=isTest
+        # The coin list only changes in set_coins, so the detached rows can be
+        # reused between queries instead of hitting the database every scout
+        self._coins_cache = {}
+        self._scout_log_buffer: List[dict] = []
+        self._scout_log_last_flush = time.monotonic()
 
     def socketio_connect(self):
         if self.isTest:    return False
@@ -83,7 +107,12 @@ class Database:
                         if pair is None:
                             session.add(Pair(from_coin, to_coin))
 
+        self._coins_cache.clear()
+
     def get_coins(self, only_enabled=True) -> List[Coin]:
+        coins = self._coins_cache.get(only_enabled)
+        if coins is not None:
+            return coins
         session: Session
         with self.db_session() as session:
             if only_enabled:
@@ -91,6 +120,7 @@ class Database:
             else:
                 coins = session.query(Coin).all()
             session.expunge_all()
+            self._coins_cache[only_enabled] = coins
             return coins
 
     def get_coin(self, coin: Union[Coin, str]) -> Coin:
@@ -157,28 +187,48 @@ class Database:
         with self.db_session() as session:
             session.add(Deposit(usd_amount, datetime))
 
+    def set_deposits(self, deposits: List[dict]):
+        """
+        Insert many deposits ({"usd_amount": ..., "datetime": ...}) in one transaction
+        """
+        if not deposits:
+            return
+        session: Session
+        with self.db_session() as session:
+            session.execute(insert(Deposit), deposits)
+
     def get_deposits(self) -> List[Deposit]:
         session: Session
         with self.db_session() as session:
             return session.query(Deposit).all()
 
     def batch_log_scout(self, logs: List[LogScout]):
-        session: Session
-        with self.db_session() as session:
+        if logs:
             dt = _datetime.now()
-            session.execute(
-                insert(ScoutHistory),
-                [
-                    {
-                        "pair_id": ls.pair.id,
-                        "target_ratio": ls.target_ratio,
-                        "current_coin_price": ls.coin_price,
-                        "other_coin_price": ls.optional_coin_price,
-                        "datetime": dt,
-                    }
-                    for ls in logs
-                ],
+            self._scout_log_buffer.extend(
+                {
+                    "pair_id": ls.pair.id,
+                    "target_ratio": ls.target_ratio,
+                    "current_coin_price": ls.coin_price,
+                    "other_coin_price": ls.optional_coin_price,
+                    "datetime": dt,
+                }
+                for ls in logs
             )
+        if (
+            len(self._scout_log_buffer) >= SCOUT_LOG_BATCH_SIZE
+            or time.monotonic() - self._scout_log_last_flush >= SCOUT_LOG_FLUSH_SECONDS
+        ):
+            self.flush_scout_log_buffer()
+
+    def flush_scout_log_buffer(self):
+        self._scout_log_last_flush = time.monotonic()
+        if not self._scout_log_buffer:
+            return
+        rows, self._scout_log_buffer = self._scout_log_buffer, []
+        session: Session
+        with self.db_session() as session:
+            session.execute(insert(ScoutHistory), rows)
 
     def log_scout(
         self,
@@ -195,6 +245,8 @@ class Database:
             self.send_update(sh)
 
     def prune_scout_history(self):
+        # Pruning should see everything scouted so far
+        self.flush_scout_log_buffer()
         time_diff = _datetime.now() - timedelta(hours=self.config.SCOUT_HISTORY_PRUNE_TIME)
         session: Session
         with self.db_session() as session:
@@ -266,6 +318,12 @@ class Database:
 
     def create_database(self):
         Base.metadata.create_all(self.engine)
+        # create_all skips tables that already exist, indexes included, so
+        # databases created before an index was declared never pick it up;
+        # create each declared index explicitly to cover existing databases
+        for table in Base.metadata.tables.values():
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
 
     def start_trade_log(self, from_coin: Coin, to_coin: Coin, selling: bool):
         return TradeLog(self, from_coin, to_coin, selling)
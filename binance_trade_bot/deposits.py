@@ -24,3 +24,23 @@ def deposit(deposit_amount: Float, datetime: _datetime, db_path="data/crypto_tra
     db.set_deposit(deposit_amount, datetime)
 
     logger.info(f"Done. Added new deposit amount of ${deposit_amount} on {datetime}")
+
+
+def deposit_batch(deposits: list, db_path="data/crypto_trading.db", config: Config = None):
+    logger = Logger()
+    logger.info("Starting add deposits")
+
+    logger.info(f'Will be using {db_path} as database')
+    dbPathUri = f"sqlite:///{db_path}"
+
+    config = config or Config()
+    db = Database(logger, config, dbPathUri)
+
+    logger.info("Creating database schema if it doesn't already exist")
+    db.create_database()
+    logger.info("Done creating database schema")
+
+    # All rows go through one bulk insert in a single transaction
+    db.set_deposits(deposits)
+
+    logger.info(f"Done. Added {len(deposits)} deposits")
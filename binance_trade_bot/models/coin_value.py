@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime as _datetime
 
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
@@ -18,11 +18,13 @@ class Interval(enum.Enum):
 
 class CoinValue(Base):
     __tablename__ = "coin_value"
+    # Value history is always read per coin ordered by time
+    __table_args__ = (Index("ix_coin_value_coin_id_datetime", "coin_id", "datetime"),)
 
     id = Column(Integer, primary_key=True)
 
     coin_id = Column(String, ForeignKey("coins.symbol"))
-    coin = relationship("Coin")
+    coin = relationship("Coin", lazy="selectin")
 
     balance = Column(Float)
     usd_price = Column(Float)
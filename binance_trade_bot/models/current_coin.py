@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime as _datetime
 
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
@@ -11,12 +11,12 @@ class CurrentCoin(Base):  # pylint: disable=too-few-public-methods
     __tablename__ = "current_coin_history"
     id = Column(Integer, primary_key=True)
     coin_id = Column(String, ForeignKey("coins.symbol"))
-    coin = relationship("Coin")
+    coin = relationship("Coin", lazy="selectin")
     datetime = Column(DateTime)
 
-    def __init__(self, coin: Coin):
+    def __init__(self, coin: Coin, datetime: _datetime = None):
         self.coin = coin
-        self.datetime = datetime.utcnow()
+        self.datetime = datetime or _datetime.utcnow()
 
     def info(self):
         return {"datetime": self.datetime.isoformat(), "coin": self.coin.info()}
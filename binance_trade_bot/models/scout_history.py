@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime as _datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
@@ -10,11 +10,16 @@ from .pair import Pair
 
 class ScoutHistory(Base):
     __tablename__ = "scout_history"
+    # Scouting history is filtered by pair and time, and pruned by time
+    __table_args__ = (
+        Index("ix_scout_history_pair_id_datetime", "pair_id", "datetime"),
+        Index("ix_scout_history_datetime", "datetime"),
+    )
 
     id = Column(Integer, primary_key=True)
 
     pair_id = Column(String, ForeignKey("pairs.id"))
-    pair = relationship("Pair")
+    pair = relationship("Pair", lazy="selectin")
 
     target_ratio = Column(Float)
     current_coin_price = Column(Float)
@@ -28,12 +33,13 @@ class ScoutHistory(Base):
         target_ratio: float,
         current_coin_price: float,
         other_coin_price: float,
+        datetime: _datetime = None,
     ):
         self.pair = pair
         self.target_ratio = target_ratio
         self.current_coin_price = current_coin_price
         self.other_coin_price = other_coin_price
-        self.datetime = datetime.utcnow()
+        self.datetime = datetime or _datetime.utcnow()
 
     @hybrid_property
     def current_ratio(self):
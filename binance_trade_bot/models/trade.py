@@ -1,5 +1,5 @@
 import enum
-from datetime import datetime
+from datetime import datetime as _datetime
 
 from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
@@ -20,10 +20,10 @@ class Trade(Base):  # pylint: disable=too-few-public-methods
     id = Column(Integer, primary_key=True)
 
     alt_coin_id = Column(String, ForeignKey("coins.symbol"))
-    alt_coin = relationship("Coin", foreign_keys=[alt_coin_id], lazy="joined")
+    alt_coin = relationship("Coin", foreign_keys=[alt_coin_id], lazy="selectin")
 
     crypto_coin_id = Column(String, ForeignKey("coins.symbol"))
-    crypto_coin = relationship("Coin", foreign_keys=[crypto_coin_id], lazy="joined")
+    crypto_coin = relationship("Coin", foreign_keys=[crypto_coin_id], lazy="selectin")
 
     selling = Column(Boolean)
 
@@ -36,12 +36,12 @@ class Trade(Base):  # pylint: disable=too-few-public-methods
 
     datetime = Column(DateTime)
 
-    def __init__(self, alt_coin: Coin, crypto_coin: Coin, selling: bool):
+    def __init__(self, alt_coin: Coin, crypto_coin: Coin, selling: bool, datetime: _datetime = None):
         self.alt_coin = alt_coin
         self.crypto_coin = crypto_coin
         self.state = TradeState.STARTING
         self.selling = selling
-        self.datetime = datetime.utcnow()
+        self.datetime = datetime or _datetime.utcnow()
 
     def info(self):
         return {
@@ -20,11 +20,12 @@ class Strategy(AutoTrader):
 
         excluded_coins = []
 
+        bridge_sym = self.config.BRIDGE.symbol
         for coin in active_coins:
-            coin_price = self.manager.get_sell_price(coin + self.config.BRIDGE)
+            coin_price = self.manager.get_sell_price(coin.symbol + bridge_sym)
 
             if coin_price is None:
-                self.logger.info("Skipping scouting... current coin {} not found".format(coin + self.config.BRIDGE))
+                self.logger.info("Skipping scouting... current coin {} not found".format(coin.symbol + bridge_sym))
                 continue
             
             if self.config.ALLOW_COIN_MERGE == False:
@@ -46,15 +47,19 @@ class Strategy(AutoTrader):
     def get_active_coins(self):
         active_coins = []
 
-        for coin in self.db.get_coins(True):
-            current_coin_balance = self.manager.get_currency_balance(coin.symbol)
-            coin_price = self.manager.get_sell_price(coin + self.config.BRIDGE)
+        bridge_sym = self.config.BRIDGE.symbol
+        coins = self.db.get_coins(True)
+        # One bulk call covers the sell price of every supported coin
+        sell_prices = self.manager.get_sell_prices([coin.symbol + bridge_sym for coin in coins])
+        for coin in coins:
+            coin_price = sell_prices[coin.symbol + bridge_sym]
 
             if coin_price is None:
-                self.logger.info("Skipping scouting... coin {} not found".format(coin + self.config.BRIDGE))
+                self.logger.info("Skipping scouting... coin {} not found".format(coin.symbol + bridge_sym))
                 continue
-            
-            min_notional = self.manager.get_min_notional(coin.symbol, self.config.BRIDGE.symbol)
+
+            current_coin_balance = self.manager.get_currency_balance(coin.symbol)
+            min_notional = self.manager.get_min_notional(coin.symbol, bridge_sym)
             if coin_price * current_coin_balance > min_notional:
                 active_coins.append(coin)
 
@@ -64,7 +69,8 @@ class Strategy(AutoTrader):
         """
         If we have any bridge coin leftover, buy a coin with it that we won't immediately trade out of
         """
-        bridge_balance = self.manager.get_currency_balance(self.config.BRIDGE.symbol)
+        bridge_sym = self.config.BRIDGE.symbol
+        bridge_balance = self.manager.get_currency_balance(bridge_sym)
 
         active_coins = self.get_active_coins()
         active_coin_symbols = [c.symbol for c in active_coins]
@@ -73,18 +79,18 @@ class Strategy(AutoTrader):
             if self.config.ALLOW_COIN_MERGE == False and coin.symbol in active_coin_symbols:
                 continue
 
-            current_coin_price = self.manager.get_sell_price(coin + self.config.BRIDGE)
+            current_coin_price = self.manager.get_sell_price(coin.symbol + bridge_sym)
 
             if current_coin_price is None:
                 continue
 
-            ratio_dict, _ = self._get_ratios(coin, current_coin_price, active_coins)
-            if not any(v > 0 for v in ratio_dict.values()):
+            _, _, vals = self._get_ratios(coin, current_coin_price, active_coins)
+            if vals.size == 0 or vals.max() <= 0:
                 # There will only be one coin where all the ratios are negative. When we find it, buy it if we can
-                if bridge_balance > self.manager.get_min_notional(coin.symbol, self.config.BRIDGE.symbol):
+                if bridge_balance > self.manager.get_min_notional(coin.symbol, bridge_sym):
                     self.logger.info(f"Will be purchasing {coin} using bridge coin")
                     result = self.manager.buy_alt(
-                        coin, self.config.BRIDGE, self.manager.get_sell_price(coin + self.config.BRIDGE)
+                        coin, self.config.BRIDGE, self.manager.get_sell_price(coin.symbol + bridge_sym)
                     )
                     if result is not None:
                         self.db.set_current_coin(coin)
@@ -1,3 +1,4 @@
+import csv
 import getopt
 import os
 import sys
@@ -5,7 +6,7 @@ from datetime import datetime as _datetime
 
 from sqlalchemy import Float
 
-from binance_trade_bot import deposit
+from binance_trade_bot import deposit, deposit_batch
 
 def OK():
     if os.name == 'nt':
@@ -19,24 +20,42 @@ def validate_datetime(date_str) -> _datetime:
     except ValueError:
         raise ValueError("Incorrect datetime format. Must match ISO8601 format YYYY-MM-DDThh:mm:ss")
 
+def read_deposits_file(file_path) -> list:
+    # CSV rows of "amount[,datetime]"; rows become plain dicts so the database
+    # can insert the whole file in one bulk statement
+    deposits = []
+    with open(file_path, newline="") as deposit_file:
+        for row in csv.reader(deposit_file):
+            if not row:
+                continue
+            deposits.append(
+                {
+                    "usd_amount": float(row[0]),
+                    "datetime": validate_datetime(row[1]) if len(row) > 1 and row[1] else _datetime.now(),
+                }
+            )
+    return deposits
+
 # main
 if __name__ == "__main__":
     db_path = "data/crypto_trading.db"
     found_amount = False
     amount = 0.0
+    file_path = None
     datetime = _datetime.now()
 
     try:
-        opts, args = getopt.getopt(sys.argv[1:], "ha:d:p:", ["amount=", "datetime=", "dbpath="])
+        opts, args = getopt.getopt(sys.argv[1:], "ha:d:p:f:", ["amount=", "datetime=", "dbpath=", "file="])
     except getopt.GetoptError:
         pass
     for opt, arg in opts:
         if opt == '-h':
             print('deposits.py - Script to add USD deposit amounts with a timestamp')
             print('parameters:')
-            print('-a, --amount <required, USD amount deposited>')
+            print('-a, --amount <required unless -f given, USD amount deposited>')
             print('-d, --datetime <optional, deposit date. Must match ISO8601 format YYYY-MM-DDThh:mm:ss. Defaults to NOW if not provided>')
             print('-p, --dbpath <optional, path to db, if not given the default db path will be used>')
+            print('-f, --file <optional, CSV file of amount,datetime rows to import in one batch>')
             os._exit(OK())
         elif opt in ("-a", "--amount"):
             found_amount = True
@@ -46,6 +65,13 @@ if __name__ == "__main__":
             print("TYPE: ", type(datetime))
         elif opt in ("-p", "--dbpath"):
             db_path = arg
+        elif opt in ("-f", "--file"):
+            file_path = arg
+
+    if file_path is not None:
+        deposit_batch(read_deposits_file(file_path), db_path)
+        os._exit(OK())
+
     if not found_amount:
         raise ValueError("amount is a required field")
 